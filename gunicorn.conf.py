@@ -0,0 +1,40 @@
+"""
+Gunicorn configuration, picked up automatically from the project root:
+
+    DJANGO_ENV=prod gunicorn job_portal.wsgi
+
+Every value can be overridden through the environment.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+
+# Classic (2 x cores) + 1 sizing; each worker also runs a few threads so slow
+# requests (resume downloads, MySQL round trips) don't block the whole worker.
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Import Django and the URLconf once in the master and fork the workers from
+# it: workers start faster and share the loaded code pages copy-on-write.
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes', 'on')
+
+# Recycle workers periodically to bound memory growth; jitter avoids all of
+# them restarting at once.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = os.environ.get('GUNICORN_ERROR_LOG', '-')
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    # Database connections must not be shared across the fork
+    from django.db import connections
+    connections.close_all()
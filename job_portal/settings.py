@@ -1,24 +1,82 @@
 import os
+import sys
 from pathlib import Path
 
+import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
+from dotenv import load_dotenv
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# MySQL Database Configuration
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        'NAME': 'jobportal_db',
-        'USER': 'root',
-        'PASSWORD': 'Meena@vts123',
-        'HOST': 'localhost',
-        'PORT': '3306',
-    }
-}
+# Values from .env never override variables already set in the environment
+load_dotenv(BASE_DIR / '.env')
+
+
+def env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def env_list(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return [item.strip() for item in value.split(',') if item.strip()]
 
-# Other settings
-SECRET_KEY = 'your-secret-key-here'
-DEBUG = True
-ALLOWED_HOSTS = ['*']
+
+# Settings profile: dev (default), test (implied by `manage.py test`) or prod
+ENVIRONMENT = os.environ.get('DJANGO_ENV') or (
+    'test' if len(sys.argv) > 1 and sys.argv[1] == 'test' else 'dev'
+)
+if ENVIRONMENT not in ('dev', 'test', 'prod'):
+    raise ImproperlyConfigured(f"DJANGO_ENV must be dev, test or prod, not {ENVIRONMENT!r}")
+IS_PROD = ENVIRONMENT == 'prod'
+
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
+if not SECRET_KEY:
+    if IS_PROD:
+        raise ImproperlyConfigured('DJANGO_SECRET_KEY must be set in production.')
+    SECRET_KEY = 'django-insecure-dev-only-key'
+
+DEBUG = env_bool('DJANGO_DEBUG', ENVIRONMENT == 'dev')
+ALLOWED_HOSTS = env_list('DJANGO_ALLOWED_HOSTS', [] if IS_PROD else ['*'])
+CSRF_TRUSTED_ORIGINS = env_list('DJANGO_CSRF_TRUSTED_ORIGINS', [])
+
+# Database: DATABASE_URL wins; otherwise MySQL for dev/prod and SQLite for tests.
+# Persistent connections avoid a new MySQL handshake on every request.
+CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', 60 if IS_PROD else 0))
+
+if os.environ.get('DATABASE_URL'):
+    DATABASES = {
+        'default': dj_database_url.parse(
+            os.environ['DATABASE_URL'],
+            conn_max_age=CONN_MAX_AGE,
+            conn_health_checks=CONN_MAX_AGE > 0,
+        )
+    }
+elif ENVIRONMENT == 'test':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+        }
+    }
+else:
+    # MySQL Database Configuration
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.mysql',
+            'NAME': os.environ.get('MYSQL_DATABASE', 'jobportal_db'),
+            'USER': os.environ.get('MYSQL_USER', 'root'),
+            'PASSWORD': os.environ.get('MYSQL_PASSWORD', ''),
+            'HOST': os.environ.get('MYSQL_HOST', 'localhost'),
+            'PORT': os.environ.get('MYSQL_PORT', '3306'),
+            'CONN_MAX_AGE': CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': CONN_MAX_AGE > 0,
+        }
+    }
 
 
 INSTALLED_APPS = [
@@ -38,6 +96,7 @@ CRISPY_TEMPLATE_PACK = 'bootstrap5'
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -64,7 +123,70 @@ TEMPLATES = [
     },
 ]
 
+WSGI_APPLICATION = 'job_portal.wsgi.application'
+
+# Static files: in prod whitenoise serves them from STATIC_ROOT, where they are
+# compressed and content-hashed at collectstatic time, which lets whitenoise
+# send far-future "immutable" cache headers for every hashed file.
 STATIC_URL = '/static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'whitenoise.storage.CompressedManifestStaticFilesStorage' if IS_PROD
+            else 'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
+WHITENOISE_MAX_AGE = int(os.environ.get('WHITENOISE_MAX_AGE', 3600 if IS_PROD else 0))
+# Outside prod, serve straight from the app/static finders so no collectstatic
+# (and no STATIC_ROOT directory) is needed.
+WHITENOISE_USE_FINDERS = not IS_PROD
+WHITENOISE_AUTOREFRESH = not IS_PROD
+
+# Cache: Redis when REDIS_URL is set (shared by all workers), otherwise a
+# per-process in-memory cache. Tests get a dummy cache so state never leaks.
+if ENVIRONMENT == 'test':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+elif os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+            'TIMEOUT': int(os.environ.get('CACHE_TIMEOUT', 300)),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'job-portal',
+            'TIMEOUT': int(os.environ.get('CACHE_TIMEOUT', 300)),
+        }
+    }
+
+# Sessions: read through the cache in prod, falling back to the database
+SESSION_ENGINE = os.environ.get(
+    'SESSION_ENGINE',
+    'django.contrib.sessions.backends.cached_db' if IS_PROD else 'django.contrib.sessions.backends.db',
+)
+
+if IS_PROD:
+    SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+    SESSION_COOKIE_SECURE = env_bool('DJANGO_SECURE_COOKIES', True)
+    CSRF_COOKIE_SECURE = env_bool('DJANGO_SECURE_COOKIES', True)
+
+if ENVIRONMENT == 'test':
+    # Hashing passwords properly dominates test run time
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -73,4 +195,10 @@ LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
 # Media files configuration
 MEDIA_URL = '/media/'
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
\ No newline at end of file
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+# Jobs closed for longer than this are moved to the archive by `manage.py archive_jobs`
+JOB_ARCHIVE_RETENTION_DAYS = 180
+
+# Estimated Jaccard similarity above which two postings count as near-duplicates
+JOB_DUPLICATE_THRESHOLD = 0.8
@@ -0,0 +1,187 @@
+"""
+Archival of closed jobs.
+
+Jobs that are inactive or past their application deadline for longer than
+the retention window are moved out of the hot `Job` / `JobApplication` /
+`Interview` tables into `ArchivedJob`, one row per job with the whole object
+graph stored as compressed JSON. Restoring re-inserts the original rows with
+their original primary keys.
+"""
+import json
+import zlib
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .dedup import index_job
+from .models import ArchivedJob, Interview, Job, JobApplication, JobCategory
+
+DEFAULT_RETENTION_DAYS = 180
+DEFAULT_BATCH_SIZE = 200
+
+
+class RestoreError(Exception):
+    pass
+
+
+class _ArchiveJSONEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder truncates datetimes to milliseconds; keep them exact so
+    # restored rows are identical to the originals.
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def retention_days():
+    return getattr(settings, 'JOB_ARCHIVE_RETENTION_DAYS', DEFAULT_RETENTION_DAYS)
+
+
+def archivable_jobs(days=None, now=None):
+    """
+    Jobs closed for more than `days` days: past their application deadline,
+    or deactivated (`closed_at`) before the cutoff. Jobs restored from the
+    archive within the window are exempt, so a restore lasts a full window.
+    """
+    if days is None:
+        days = retention_days()
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=days)
+    return Job.objects.filter(
+        Q(is_active=False, closed_at__lt=cutoff) |
+        Q(application_deadline__lt=cutoff.date())
+    ).exclude(restored_at__gte=cutoff).order_by('id')
+
+
+def _pack(job, applications, interviews):
+    document = {
+        'job': serializers.serialize('python', [job]),
+        'applications': serializers.serialize('python', applications),
+        'interviews': serializers.serialize('python', interviews),
+    }
+    raw = json.dumps(document, cls=_ArchiveJSONEncoder)
+    return zlib.compress(raw.encode('utf-8'), 6)
+
+
+def unpack(archived):
+    """Decode an ArchivedJob payload back into its serialized parts."""
+    return json.loads(zlib.decompress(bytes(archived.payload)).decode('utf-8'))
+
+
+def archive_batch(job_ids, days=None, now=None):
+    """
+    Archive the given jobs in a single transaction and return how many were
+    moved. Rows are locked and eligibility is checked again under the lock, so
+    a job reactivated or extended since it was selected stays live and
+    concurrent runs cannot archive a job twice.
+    """
+    with transaction.atomic():
+        jobs = list(archivable_jobs(days=days, now=now).select_for_update().filter(id__in=job_ids))
+        if not jobs:
+            return 0
+
+        applications_by_job = {}
+        for application in JobApplication.objects.filter(job__in=jobs).order_by('id'):
+            applications_by_job.setdefault(application.job_id, []).append(application)
+
+        interviews_by_job = {}
+        for interview in Interview.objects.filter(application__job__in=jobs)\
+                                          .select_related('application').order_by('id'):
+            interviews_by_job.setdefault(interview.application.job_id, []).append(interview)
+
+        ArchivedJob.objects.bulk_create([
+            ArchivedJob(
+                original_job_id=job.id,
+                employer_id=job.employer_id,
+                title=job.title,
+                job_type=job.job_type,
+                location=job.location,
+                posted_date=job.posted_date,
+                application_deadline=job.application_deadline,
+                application_count=len(applications_by_job.get(job.id, [])),
+                interview_count=len(interviews_by_job.get(job.id, [])),
+                payload=_pack(
+                    job,
+                    applications_by_job.get(job.id, []),
+                    interviews_by_job.get(job.id, []),
+                ),
+            )
+            for job in jobs
+        ])
+
+        # Applications and interviews go with the job via on_delete=CASCADE.
+        Job.objects.filter(id__in=[job.id for job in jobs]).delete()
+        return len(jobs)
+
+
+def archive_jobs(days=None, batch_size=DEFAULT_BATCH_SIZE, limit=None, now=None):
+    """
+    Archive every eligible job in chunks of `batch_size`.
+
+    Each chunk commits on its own, so an interrupted run can simply be started
+    again: archived jobs are no longer in `Job` and are not picked up twice.
+    Yields the running total after each chunk.
+    """
+    total = 0
+    last_id = 0
+    queryset = archivable_jobs(days=days, now=now)
+    while limit is None or total < limit:
+        size = batch_size if limit is None else min(batch_size, limit - total)
+        job_ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:size])
+        if not job_ids:
+            break
+        last_id = job_ids[-1]
+        total += archive_batch(job_ids, days=days, now=now)
+        yield total
+
+
+def restore_job(archived):
+    """
+    Move an archived job back into the live tables.
+
+    The job is stamped with `restored_at` so the next archive run leaves it
+    alone for a full retention window. Applications whose applicant account
+    no longer exists are dropped, along with their interviews. Raises
+    RestoreError if the original id has been reused or the job's category has
+    been deleted.
+    """
+    document = unpack(archived)
+
+    with transaction.atomic():
+        if Job.objects.filter(id=archived.original_job_id).exists():
+            raise RestoreError('A job with the original id already exists.')
+
+        job_objects = list(serializers.deserialize('python', document['job']))
+        job = job_objects[0].object
+        if not JobCategory.objects.filter(id=job.category_id).exists():
+            raise RestoreError('The category of this job no longer exists.')
+        if job.duplicate_of_id and not Job.objects.filter(id=job.duplicate_of_id).exists():
+            job.duplicate_of = None
+        job.restored_at = timezone.now()
+        job_objects[0].save()
+        index_job(job)
+
+        applications = list(serializers.deserialize('python', document['applications']))
+        existing_users = set(
+            User.objects.filter(
+                id__in=[d.object.applicant_id for d in applications]
+            ).values_list('id', flat=True)
+        )
+        restored_application_ids = set()
+        for deserialized in applications:
+            if deserialized.object.applicant_id in existing_users:
+                deserialized.save()
+                restored_application_ids.add(deserialized.object.id)
+
+        for deserialized in serializers.deserialize('python', document['interviews']):
+            if deserialized.object.application_id in restored_application_ids:
+                deserialized.save()
+
+        archived.delete()
+    return job
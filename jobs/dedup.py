@@ -0,0 +1,175 @@
+"""
+Near-duplicate detection for job postings.
+
+Each job gets a MinHash signature over word shingles of its title,
+description and requirements. The signature is split into LSH bands and
+every band is stored as a (band, bucket) row, so finding candidates for a new
+posting is one indexed lookup instead of a comparison against every job.
+Candidates are then confirmed by the estimated Jaccard similarity of their
+full signatures.
+
+Signatures use one-permutation hashing: every shingle is hashed once and
+lands in one of NUM_PERM bins, keeping the minimum per bin, instead of being
+hashed NUM_PERM times. Computing a signature is pure Python and costs about
+1.5 ms for a 600-word posting; the candidate lookup itself is one indexed
+query. Changing the hashing scheme invalidates stored signatures, so run
+`manage.py dedupe_jobs` afterwards.
+"""
+import hashlib
+import re
+from array import array
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Job, JobSignature, JobSignatureBand
+
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8
+
+_MAX_HASH = (1 << 32) - 1
+_EMPTY = 1 << 32
+_GOLDEN = 0x9E3779B1
+_WORD_RE = re.compile(r'\w+')
+
+
+def similarity_threshold():
+    return getattr(settings, 'JOB_DUPLICATE_THRESHOLD', DEFAULT_THRESHOLD)
+
+
+def _hash64(data):
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def shingles(text):
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {' '.join(words)} if words else set()
+    return {
+        ' '.join(words[i:i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def job_text(job):
+    return ' '.join([job.title or '', job.description or '', job.requirements or ''])
+
+
+def minhash(text):
+    """Return the MinHash signature of `text` as a list of NUM_PERM ints."""
+    signature = [_EMPTY] * NUM_PERM
+    for shingle in shingles(text):
+        h = _hash64(shingle.encode('utf-8'))
+        # Low bits pick the bin (NUM_PERM is a power of two), high bits are the value
+        bin_, value = h & (NUM_PERM - 1), h >> 32
+        if value < signature[bin_]:
+            signature[bin_] = value
+
+    filled = [i for i, value in enumerate(signature) if value != _EMPTY]
+    if not filled:
+        return [_MAX_HASH] * NUM_PERM
+    if len(filled) < NUM_PERM:
+        # Rotation densification: an empty bin borrows the nearest filled bin to
+        # its right (wrapping around), tagged with the distance so that two texts
+        # only agree on it when they borrowed from the same place.
+        original = list(signature)
+        nearest = filled[0] + NUM_PERM
+        for i in range(NUM_PERM - 1, -1, -1):
+            if original[i] != _EMPTY:
+                nearest = i
+            else:
+                distance = nearest - i
+                signature[i] = (original[nearest % NUM_PERM] + distance * _GOLDEN) & _MAX_HASH
+    return signature
+
+
+def band_buckets(signature):
+    """Yield (band, bucket) pairs; bucket is a signed 64-bit hash of the band."""
+    for band in range(BANDS):
+        rows = array('I', signature[band * ROWS:(band + 1) * ROWS]).tobytes()
+        yield band, int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), 'little', signed=True)
+
+
+def estimated_similarity(sig_a, sig_b):
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def _encode(signature):
+    return array('I', signature).tobytes()
+
+
+def _decode(data):
+    signature = array('I')
+    signature.frombytes(bytes(data))
+    return signature.tolist()
+
+
+def find_duplicates(signature, exclude_id=None, threshold=None):
+    """
+    Return [(job_id, similarity)] for indexed jobs whose signature is at least
+    `threshold` similar to `signature`, most similar first.
+    """
+    if threshold is None:
+        threshold = similarity_threshold()
+
+    band_filter = Q()
+    for band, bucket in band_buckets(signature):
+        band_filter |= Q(band=band, bucket=bucket)
+    candidates = JobSignatureBand.objects.filter(band_filter)
+    if exclude_id is not None:
+        candidates = candidates.exclude(job_id=exclude_id)
+    candidate_ids = set(candidates.values_list('job_id', flat=True))
+    if not candidate_ids:
+        return []
+
+    matches = []
+    for job_id, data in JobSignature.objects.filter(job_id__in=candidate_ids)\
+                                            .values_list('job_id', 'signature'):
+        similarity = estimated_similarity(signature, _decode(data))
+        if similarity >= threshold:
+            matches.append((job_id, similarity))
+    matches.sort(key=lambda match: (-match[1], match[0]))
+    return matches
+
+
+def index_job(job, signature=None):
+    """Store (or replace) the signature and LSH bands of a saved job."""
+    if signature is None:
+        signature = minhash(job_text(job))
+    with transaction.atomic():
+        JobSignature.objects.update_or_create(job=job, defaults={'signature': _encode(signature)})
+        JobSignatureBand.objects.filter(job=job).delete()
+        JobSignatureBand.objects.bulk_create([
+            JobSignatureBand(job=job, band=band, bucket=bucket)
+            for band, bucket in band_buckets(signature)
+        ])
+    return signature
+
+
+def check_new_job(job):
+    """
+    Classify an unsaved job against the catalog.
+
+    Returns (existing_job, signature). `existing_job` is the closest open
+    (active and not past its deadline) near-duplicate, preferring the same
+    employer's own postings, or None.
+    """
+    signature = minhash(job_text(job))
+    matches = find_duplicates(signature, exclude_id=job.pk)
+    if not matches:
+        return None, signature
+
+    # Jobs past their deadline are closed; reposting the same role is legitimate
+    by_id = Job.objects.filter(id__in=[job_id for job_id, _ in matches], is_active=True,
+                               application_deadline__gte=timezone.now().date())\
+                       .in_bulk()
+    ranked = [by_id[job_id] for job_id, _ in matches if job_id in by_id]
+    for existing in ranked:
+        if existing.employer_id == job.employer_id:
+            return existing, signature
+    return (ranked[0] if ranked else None), signature
@@ -0,0 +1,178 @@
+"""
+Offline geocoding and radius search for job locations.
+
+Free-text `Job.location` values are resolved against a gazetteer bundled in
+jobs/data/cities.csv and stored in `Job.latitude` / `Job.longitude`. Radius
+queries go through an in-memory grid of active, geocoded, non-remote jobs and
+return candidate ids, so `job_list` only hands the ORM an `id__in` filter.
+Remote jobs have no meaningful position and are never indexed.
+"""
+import csv
+import math
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from .models import Job
+
+GAZETTEER_PATH = Path(__file__).resolve().parent / 'data' / 'cities.csv'
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+CELL_DEGREES = 1.0
+INDEX_TTL_SECONDS = 300
+DEFAULT_RADIUS_KM = 50
+MAX_RADIUS_KM = 1000
+
+_SPLIT_RE = re.compile(r'\s*(?:,|/|\||;|\s-\s|\(|\))\s*')
+
+
+def _normalize(text):
+    return ' '.join(text.lower().replace('.', ' ').split())
+
+
+@lru_cache(maxsize=1)
+def gazetteer():
+    """Map of normalized place names, aliases and "city, region" to (lat, lon)."""
+    places = {}
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            point = (float(row['latitude']), float(row['longitude']))
+            names = [row['name']] + [alias for alias in row['aliases'].split('|') if alias]
+            for name in names:
+                # First entry wins for ambiguous names
+                places.setdefault(_normalize(name), point)
+                if row['region']:
+                    places.setdefault(_normalize(f"{name} {row['region']}"), point)
+    return places
+
+
+@lru_cache(maxsize=4096)
+def geocode(location):
+    """Return (lat, lon) for a free-text location, or None if it is unknown."""
+    if not location:
+        return None
+    places = gazetteer()
+    normalized = _normalize(location)
+    if normalized in places:
+        return places[normalized]
+
+    parts = [_normalize(part) for part in _SPLIT_RE.split(location) if part.strip()]
+    # "Chennai, Tamil Nadu" / "Austin, TX": try "city region" first, then each part
+    for city, region in zip(parts, parts[1:]):
+        if f'{city} {region}' in places:
+            return places[f'{city} {region}']
+    for part in parts:
+        if part in places:
+            return places[part]
+    return None
+
+
+def _parse_float(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    # float() also accepts "nan" and "inf"
+    return number if math.isfinite(number) else None
+
+
+def parse_point(lat, lon):
+    """Parse request lat/lon strings into (lat, lon), or None if either is invalid."""
+    lat, lon = _parse_float(lat), _parse_float(lon)
+    if lat is None or lon is None or not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        return None
+    return lat, lon
+
+
+def parse_radius(value):
+    """Parse a request radius in km, clamped to [1, MAX_RADIUS_KM]; default on bad input."""
+    radius = _parse_float(value)
+    if radius is None:
+        return DEFAULT_RADIUS_KM
+    return min(max(radius, 1), MAX_RADIUS_KM)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _cell(lat, lon):
+    return (math.floor(lat / CELL_DEGREES),
+            math.floor(lon / CELL_DEGREES) % int(360 / CELL_DEGREES))
+
+
+class GridIndex:
+    """Fixed-size lat/lon grid of (job_id, lat, lon) points."""
+
+    def __init__(self, points=()):
+        self.cells = {}
+        self.size = 0
+        for job_id, lat, lon in points:
+            self.cells.setdefault(_cell(lat, lon), []).append((job_id, lat, lon))
+            self.size += 1
+
+    def within(self, lat, lon, radius_km):
+        """Return {job_id: distance_km} for points within radius_km of (lat, lon)."""
+        lat_span = radius_km / KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(abs(lat) + lat_span, 89.9)))
+        lon_span = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+
+        lon_cells = int(360 / CELL_DEGREES)
+        min_row, max_row = (math.floor((lat - lat_span) / CELL_DEGREES),
+                            math.floor((lat + lat_span) / CELL_DEGREES))
+        min_col, max_col = (math.floor((lon - lon_span) / CELL_DEGREES),
+                            math.floor((lon + lon_span) / CELL_DEGREES))
+        cols = {col % lon_cells for col in range(min_col, max_col + 1)}
+
+        found = {}
+        for row in range(min_row, max_row + 1):
+            for col in cols:
+                for job_id, job_lat, job_lon in self.cells.get((row, col), ()):
+                    distance = haversine_km(lat, lon, job_lat, job_lon)
+                    if distance <= radius_km:
+                        found[job_id] = distance
+        return found
+
+
+_index = None
+_index_built_at = 0.0
+_index_lock = threading.Lock()
+
+
+def invalidate_index():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def job_index():
+    """
+    The grid of active on-site jobs, rebuilt lazily. Jobs posted in this
+    process invalidate it immediately; other workers pick changes up after
+    INDEX_TTL_SECONDS.
+    """
+    global _index, _index_built_at
+    with _index_lock:
+        if _index is None or time.monotonic() - _index_built_at > INDEX_TTL_SECONDS:
+            points = Job.objects.filter(is_active=True, latitude__isnull=False, longitude__isnull=False)\
+                                .exclude(job_type='remote')\
+                                .values_list('id', 'latitude', 'longitude')
+            _index = GridIndex(points.iterator())
+            _index_built_at = time.monotonic()
+        return _index
+
+
+def jobs_near(lat, lon, radius_km):
+    return job_index().within(lat, lon, radius_km)
+
+
+def set_coordinates(job):
+    """Fill in job.latitude / job.longitude from job.location (None for remote jobs)."""
+    point = None if job.job_type == 'remote' else geocode(job.location)
+    job.latitude, job.longitude = point if point else (None, None)
+    return point is not None
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from jobs.archive import DEFAULT_BATCH_SIZE, archivable_jobs, archive_jobs, retention_days
+
+
+class Command(BaseCommand):
+    help = (
+        'Move jobs that have been closed for longer than the retention window, '
+        'with their applications and interviews, into compressed archive storage. '
+        'Safe to interrupt and re-run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Retention window in days (default: JOB_ARCHIVE_RETENTION_DAYS).')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help='Jobs archived per transaction.')
+        parser.add_argument('--limit', type=int, default=None,
+                            help='Stop after archiving this many jobs.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only report how many jobs would be archived.')
+
+    def handle(self, *args, **options):
+        days = options['days'] if options['days'] is not None else retention_days()
+
+        if options['dry_run']:
+            count = archivable_jobs(days=days).count()
+            self.stdout.write(f'{count} job(s) closed for more than {days} days would be archived.')
+            return
+
+        total = 0
+        for total in archive_jobs(days=days, batch_size=options['batch_size'], limit=options['limit']):
+            self.stdout.write(f'Archived {total} job(s) so far...')
+        self.stdout.write(self.style.SUCCESS(f'Archived {total} job(s).'))
@@ -0,0 +1,56 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Runs in a fresh interpreter so nothing is already imported or cached.
+PROBE = """
+import json, os, time
+start = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+setup = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+from django.template.loader import get_template
+get_template('base.html')
+ready = time.perf_counter()
+print(json.dumps({'setup': setup - start, 'ready': ready - start}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure cold start time of the WSGI application: Django setup, then '
+        'URLconf, views and base template loaded. This is the work gunicorn '
+        'saves per worker with preload_app.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=10, help='Number of fresh interpreters to time.')
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'job_portal.settings'))
+        env.setdefault('DJANGO_ENV', settings.ENVIRONMENT)
+
+        results = {'setup': [], 'ready': []}
+        for _ in range(options['runs']):
+            output = subprocess.run(
+                [sys.executable, '-c', PROBE],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+            ).stdout
+            timings = json.loads(output.strip().splitlines()[-1])
+            for key in results:
+                results[key].append(timings[key] * 1000)
+
+        self.stdout.write(f"Profile: {env['DJANGO_ENV']}, {options['runs']} run(s)")
+        for key, label in (('setup', 'django setup'), ('ready', 'app ready')):
+            values = results[key]
+            self.stdout.write(
+                f'{label:>13}: min {min(values):7.1f} ms   '
+                f'median {statistics.median(values):7.1f} ms   max {max(values):7.1f} ms'
+            )
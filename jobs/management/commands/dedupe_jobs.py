@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.dedup import find_duplicates, index_job, job_text, minhash
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the MinHash/LSH index for every job and flag near-duplicate '
+        'postings against the earliest matching job.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threshold', type=float, default=None,
+                            help='Minimum estimated similarity (default: JOB_DUPLICATE_THRESHOLD).')
+        parser.add_argument('--deactivate', action='store_true',
+                            help="Also deactivate duplicates of the same employer's own postings.")
+        parser.add_argument('--chunk-size', type=int, default=500,
+                            help='Jobs fetched from the database at a time.')
+
+    def handle(self, *args, **options):
+        # The index is replaced job by job rather than wiped up front, so
+        # post_job keeps checking against a complete index while this runs and
+        # an interrupted run leaves every job indexed.
+        # Oldest first, and only matches with lower ids count: every job is
+        # compared with jobs posted before it (already re-indexed by this run)
+        # and the earliest posting of a group becomes the original. As in
+        # post_job, only open originals (active and not past their deadline)
+        # count, so reposting a closed role is not flagged.
+        jobs = Job.objects.only(
+            'id', 'title', 'description', 'requirements', 'employer_id', 'is_active',
+            'application_deadline', 'duplicate_of_id'
+        ).order_by('id')
+
+        today = timezone.now().date()
+        roots = {}
+        open_employers = {}
+        flagged = deactivated = total = 0
+        for job in jobs.iterator(chunk_size=options['chunk_size']):
+            total += 1
+            signature = minhash(job_text(job))
+            matches = [
+                match for match in find_duplicates(signature, exclude_id=job.id, threshold=options['threshold'])
+                if match[0] in open_employers
+            ]
+
+            original_id = None
+            if matches:
+                original_id = roots.get(matches[0][0], matches[0][0])
+                roots[job.id] = original_id
+
+            changes = {}
+            if job.duplicate_of_id != original_id:
+                changes['duplicate_of_id'] = original_id
+            if (original_id and options['deactivate'] and job.is_active
+                    and open_employers.get(original_id) == job.employer_id):
+                changes['is_active'] = False
+                changes['closed_at'] = timezone.now()
+                deactivated += 1
+            elif job.is_active and job.application_deadline >= today:
+                open_employers[job.id] = job.employer_id
+            with transaction.atomic():
+                if changes:
+                    Job.objects.filter(id=job.id).update(**changes)
+                index_job(job, signature)
+            if original_id:
+                flagged += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {total} job(s); {flagged} flagged as near-duplicates, {deactivated} deactivated.'
+        ))
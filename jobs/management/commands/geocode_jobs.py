@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from jobs.geo import set_coordinates
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = 'Resolve job locations to coordinates using the bundled gazetteer.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='Re-geocode every job, not only those without coordinates.')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Jobs written per bulk update.')
+
+    def handle(self, *args, **options):
+        jobs = Job.objects.only('id', 'location', 'job_type', 'latitude', 'longitude').order_by('id')
+        if not options['all']:
+            jobs = jobs.filter(latitude__isnull=True).exclude(job_type='remote')
+
+        batch = []
+        resolved = unresolved = 0
+        for job in jobs.iterator(chunk_size=options['batch_size']):
+            if set_coordinates(job):
+                resolved += 1
+            else:
+                unresolved += 1
+            batch.append(job)
+            if len(batch) >= options['batch_size']:
+                Job.objects.bulk_update(batch, ['latitude', 'longitude'])
+                batch = []
+        if batch:
+            Job.objects.bulk_update(batch, ['latitude', 'longitude'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Geocoded {resolved} job(s); {unresolved} location(s) not found in the gazetteer or remote.'
+        ))
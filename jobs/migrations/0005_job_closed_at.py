@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:47
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def stamp_inactive_jobs(apps, schema_editor):
+    # The deactivation date of existing inactive jobs is unknown; start their
+    # retention window now rather than archiving them immediately.
+    Job = apps.get_model('jobs', 'Job')
+    Job.objects.filter(is_active=False, closed_at__isnull=True).update(closed_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(stamp_inactive_jobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_closed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='restored_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
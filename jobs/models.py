@@ -41,6 +41,9 @@ class Job(models.Model):
     category = models.ForeignKey(JobCategory, on_delete=models.CASCADE)
     job_type = models.CharField(max_length=20, choices=JOB_TYPES)
     location = models.CharField(max_length=100)
+    # Resolved from `location` against the bundled gazetteer (see jobs/geo.py)
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
     salary = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     employer = models.ForeignKey(User, on_delete=models.CASCADE, limit_choices_to={'userprofile__user_type': 'employer'})
     requirements = models.TextField()
@@ -48,6 +51,13 @@ class Job(models.Model):
     posted_date = models.DateTimeField(auto_now_add=True)
     application_deadline = models.DateField()
     is_active = models.BooleanField(default=True)
+    # When the job was deactivated; the archive retention window counts from here
+    closed_at = models.DateTimeField(blank=True, null=True)
+    # When the job was last restored from the archive; restarts the retention window
+    restored_at = models.DateTimeField(blank=True, null=True)
+    # Set when the posting is a near-duplicate of an earlier job (see jobs/dedup.py)
+    duplicate_of = models.ForeignKey('self', on_delete=models.SET_NULL, blank=True, null=True,
+                                     related_name='duplicates')
     
     def __str__(self):
         return self.title
@@ -90,4 +100,44 @@ class Interview(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
-        return f"Interview for {self.application.job.title}"
\ No newline at end of file
+        return f"Interview for {self.application.job.title}"
+
+class JobSignature(models.Model):
+    # MinHash signature of title + description + requirements, packed as uint32s
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name='signature')
+    signature = models.BinaryField()
+
+class JobSignatureBand(models.Model):
+    # One row per LSH band; jobs sharing any (band, bucket) are duplicate candidates
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='signature_bands')
+    band = models.PositiveSmallIntegerField()
+    bucket = models.BigIntegerField()
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['band', 'bucket']),
+        ]
+
+class ArchivedJob(models.Model):
+    # Cold-storage copy of a Job together with its applications and interviews.
+    # The full object graph lives in `payload` as zlib-compressed JSON; the
+    # remaining columns are a small denormalized summary for the read-only view.
+    original_job_id = models.BigIntegerField(unique=True)
+    employer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_jobs')
+    title = models.CharField(max_length=200)
+    job_type = models.CharField(max_length=20, choices=Job.JOB_TYPES)
+    location = models.CharField(max_length=100)
+    posted_date = models.DateTimeField()
+    application_deadline = models.DateField()
+    application_count = models.PositiveIntegerField(default=0)
+    interview_count = models.PositiveIntegerField(default=0)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    payload = models.BinaryField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employer', '-archived_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.title} (archived)"
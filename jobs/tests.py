@@ -1,3 +1,543 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .archive import RestoreError, archivable_jobs, archive_batch, archive_jobs, restore_job
+from .dedup import NUM_PERM, check_new_job, estimated_similarity, find_duplicates, index_job, job_text, minhash
+from .geo import (DEFAULT_RADIUS_KM, MAX_RADIUS_KM, GridIndex, geocode, invalidate_index, parse_point,
+                  parse_radius, set_coordinates)
+from .models import UserProfile, Job, JobApplication, Interview, JobCategory, ArchivedJob, JobSignature
+
+
+class BulkUpdateApplicationsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user('employer', password='pw')
+        UserProfile.objects.create(user=cls.employer, user_type='employer')
+        cls.other_employer = User.objects.create_user('other', password='pw')
+        UserProfile.objects.create(user=cls.other_employer, user_type='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+        cls.job = cls.make_job(cls.employer)
+        cls.other_job = cls.make_job(cls.other_employer)
+
+    @classmethod
+    def make_job(cls, employer):
+        return Job.objects.create(
+            title='Developer', description='Build things', category=cls.category,
+            job_type='full_time', location='Chennai', employer=employer,
+            requirements='Python', skills_required='Python',
+            application_deadline=timezone.now().date() + timedelta(days=30),
+        )
+
+    def make_applications(self, job, count, prefix):
+        # Re-read rows after bulk_create: MySQL does not return the new primary keys
+        User.objects.bulk_create([User(username=f'{prefix}{i}') for i in range(count)])
+        seekers = list(User.objects.filter(username__startswith=prefix).order_by('id'))
+        UserProfile.objects.bulk_create([UserProfile(user=user, user_type='job_seeker') for user in seekers])
+        JobApplication.objects.bulk_create([
+            JobApplication(job=job, applicant=user, cover_letter='Hello') for user in seekers
+        ])
+        return list(JobApplication.objects.filter(job=job, applicant__in=seekers).order_by('id'))
+
+    def post(self, data):
+        self.client.force_login(self.employer)
+        return self.client.post(reverse('bulk_update_applications'), data)
+
+    def test_set_status_updates_selected_only(self):
+        applications = self.make_applications(self.job, 4, 'seeker')
+        selected = [applications[0].id, applications[1].id]
+
+        response = self.post({'action': 'set_status', 'status': 'shortlisted', 'application_ids': selected})
+
+        self.assertRedirects(response, reverse('employer_dashboard'))
+        self.assertEqual(
+            set(JobApplication.objects.filter(status='shortlisted').values_list('id', flat=True)),
+            set(selected),
+        )
+
+    def test_rejects_selection_containing_other_employers_application(self):
+        own = self.make_applications(self.job, 1, 'own')
+        foreign = self.make_applications(self.other_job, 1, 'foreign')
+
+        self.post({'action': 'set_status', 'status': 'rejected',
+                   'application_ids': [own[0].id, foreign[0].id]})
+
+        self.assertFalse(JobApplication.objects.filter(status='rejected').exists())
+
+    def test_interview_scheduled_is_not_a_bulk_status(self):
+        applications = self.make_applications(self.job, 1, 'seeker')
+
+        self.post({'action': 'set_status', 'status': 'interview_scheduled',
+                   'application_ids': [applications[0].id]})
+
+        self.assertEqual(JobApplication.objects.get().status, 'applied')
+
+    def test_reject_others_keeps_selection_and_later_stages(self):
+        applications = self.make_applications(self.job, 4, 'seeker')
+        JobApplication.objects.filter(id=applications[3].id).update(status='hired')
+        foreign = self.make_applications(self.other_job, 1, 'foreign')
+
+        self.post({'action': 'reject_others', 'application_ids': [applications[0].id]})
+
+        statuses = dict(JobApplication.objects.values_list('id', 'status'))
+        self.assertEqual(statuses[applications[0].id], 'applied')
+        self.assertEqual(statuses[applications[1].id], 'rejected')
+        self.assertEqual(statuses[applications[2].id], 'rejected')
+        self.assertEqual(statuses[applications[3].id], 'hired')
+        self.assertEqual(statuses[foreign[0].id], 'applied')
+
+    def test_rejecting_cancels_scheduled_interview(self):
+        applications = self.make_applications(self.job, 1, 'seeker')
+        application = applications[0]
+        JobApplication.objects.filter(id=application.id).update(status='interview_scheduled')
+        Interview.objects.create(application=application, scheduled_date=timezone.now(), duration=30,
+                                 interview_type='video', location_or_link='https://example.com')
+
+        self.post({'action': 'set_status', 'status': 'rejected', 'application_ids': [application.id]})
+
+        self.assertEqual(JobApplication.objects.get().status, 'rejected')
+        self.assertFalse(Interview.objects.exists())
+
+    def test_moving_back_from_interview_cancels_it_unless_hired(self):
+        applications = self.make_applications(self.job, 2, 'seeker')
+        JobApplication.objects.filter(job=self.job).update(status='interview_scheduled')
+        for application in applications:
+            Interview.objects.create(application=application, scheduled_date=timezone.now(), duration=30,
+                                     interview_type='video', location_or_link='https://example.com')
+
+        self.post({'action': 'set_status', 'status': 'shortlisted', 'application_ids': [applications[0].id]})
+        self.post({'action': 'set_status', 'status': 'hired', 'application_ids': [applications[1].id]})
+
+        self.assertEqual(list(Interview.objects.values_list('application_id', flat=True)), [applications[1].id])
+        response = self.client.post(reverse('schedule_interview', args=[applications[0].id]), {
+            'scheduled_date': '2030-01-01T10:00', 'duration': 30, 'interview_type': 'phone',
+            'location_or_link': 'Call', 'notes': '',
+        })
+        self.assertRedirects(response, reverse('employer_dashboard'))
+        self.assertEqual(Interview.objects.count(), 2)
+
+    def test_shortlist_top_rejects_other_employers_job(self):
+        self.make_applications(self.other_job, 2, 'foreign')
+
+        response = self.post({'action': 'shortlist_top', 'job_id': self.other_job.id, 'top_n': 2})
+
+        messages = [str(message) for message in get_messages(response.wsgi_request)]
+        self.assertEqual(messages, ['That job does not belong to you.'])
+        self.assertFalse(JobApplication.objects.filter(status='shortlisted').exists())
+
+    def test_shortlist_top_picks_earliest_applicants(self):
+        applications = self.make_applications(self.job, 5, 'seeker')
+        for offset, application in enumerate(applications):
+            JobApplication.objects.filter(id=application.id).update(
+                applied_date=timezone.now() - timedelta(days=10 - offset))
+
+        self.post({'action': 'shortlist_top', 'job_id': self.job.id, 'top_n': 2})
+
+        self.assertEqual(
+            set(JobApplication.objects.filter(status='shortlisted').values_list('id', flat=True)),
+            {applications[0].id, applications[1].id},
+        )
+
+    def test_query_count_is_independent_of_batch_size(self):
+        small = self.make_applications(self.job, 3, 'small')
+        large_job = self.make_job(self.employer)
+        large = self.make_applications(large_job, 60, 'large')
+        self.client.force_login(self.employer)
+        url = reverse('bulk_update_applications')
+
+        def count_queries(data):
+            with CaptureQueriesContext(connection) as queries:
+                self.client.post(url, data)
+            return len(queries)
+
+        shortlist = {'action': 'shortlist_top'}
+        self.assertEqual(count_queries(dict(shortlist, job_id=self.job.id, top_n=len(small))),
+                         count_queries(dict(shortlist, job_id=large_job.id, top_n=len(large))))
+
+        set_status = {'action': 'set_status', 'status': 'rejected'}
+        self.assertEqual(count_queries(dict(set_status, application_ids=[a.id for a in small])),
+                         count_queries(dict(set_status, application_ids=[a.id for a in large])))
+
+        self.assertEqual(JobApplication.objects.filter(status='rejected').count(), len(small) + len(large))
+
+
+class ArchiveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user('employer', password='pw')
+        UserProfile.objects.create(user=cls.employer, user_type='employer')
+        cls.other_employer = User.objects.create_user('other', password='pw')
+        UserProfile.objects.create(user=cls.other_employer, user_type='employer')
+        cls.seeker = User.objects.create_user('seeker', password='pw')
+        UserProfile.objects.create(user=cls.seeker, user_type='job_seeker')
+        cls.category = JobCategory.objects.create(name='Engineering')
+
+    def make_job(self, days_past_deadline=400, employer=None, **fields):
+        defaults = dict(
+            title='Developer', description='Build things', category=self.category,
+            job_type='full_time', location='Chennai', employer=employer or self.employer,
+            requirements='Python', skills_required='Python',
+            application_deadline=timezone.now().date() - timedelta(days=days_past_deadline),
+        )
+        defaults.update(fields)
+        return Job.objects.create(**defaults)
+
+    def snapshot(self):
+        return (
+            list(Job.objects.order_by('id').values()),
+            list(JobApplication.objects.order_by('id').values()),
+            list(Interview.objects.order_by('id').values()),
+        )
+
+    def test_round_trip_restores_identical_rows(self):
+        job = self.make_job(salary='50000.00', latitude=13.08, longitude=80.27)
+        application = JobApplication.objects.create(job=job, applicant=self.seeker,
+                                                    cover_letter='Hello', status='interview_scheduled')
+        Interview.objects.create(application=application, scheduled_date=timezone.now(), duration=45,
+                                 interview_type='video', location_or_link='https://example.com', notes='Bring code')
+        before = self.snapshot()
+
+        self.assertEqual(list(archive_jobs()), [1])
+        self.assertEqual(self.snapshot(), ([], [], []))
+        archived = ArchivedJob.objects.get()
+        self.assertEqual((archived.original_job_id, archived.application_count, archived.interview_count),
+                         (job.id, 1, 1))
+
+        restored = restore_job(archived)
+
+        self.assertIsNotNone(restored.restored_at)
+        Job.objects.filter(id=job.id).update(restored_at=None)
+        self.assertEqual(self.snapshot(), before)
+        self.assertFalse(ArchivedJob.objects.exists())
+
+    def test_restored_job_is_kept_for_a_full_window(self):
+        job = self.make_job()
+        list(archive_jobs())
+        restore_job(ArchivedJob.objects.get())
+
+        self.assertEqual(list(archive_jobs()), [])
+        self.assertTrue(Job.objects.filter(id=job.id).exists())
+
+        later = timezone.now() + timedelta(days=181)
+        self.assertEqual(list(archive_jobs(now=later)), [1])
+
+    def test_archive_batch_rechecks_eligibility(self):
+        job = self.make_job()
+        selected = list(archivable_jobs().values_list('id', flat=True))
+        Job.objects.filter(id=job.id).update(application_deadline=timezone.now().date() + timedelta(days=30))
+
+        self.assertEqual(archive_batch(selected), 0)
+        self.assertFalse(ArchivedJob.objects.exists())
+
+    def test_chunked_run_respects_limit_and_resumes(self):
+        for _ in range(5):
+            self.make_job()
+        self.make_job(days_past_deadline=-30)
+
+        self.assertEqual(list(archive_jobs(batch_size=2, limit=3)), [2, 3])
+        self.assertEqual(ArchivedJob.objects.count(), 3)
+        self.assertEqual(list(archive_jobs(batch_size=2)), [2])
+        self.assertEqual(list(archive_jobs(batch_size=2)), [])
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_retention_counts_from_deactivation(self):
+        old = timezone.now() - timedelta(days=400)
+        recently_closed = self.make_job(days_past_deadline=-30, is_active=False, closed_at=timezone.now())
+        Job.objects.filter(id=recently_closed.id).update(posted_date=old)
+        long_closed = self.make_job(days_past_deadline=-30, is_active=False, closed_at=old)
+
+        self.assertEqual(list(archivable_jobs().values_list('id', flat=True)), [long_closed.id])
+
+    def test_restore_fails_when_original_id_reused(self):
+        job = self.make_job()
+        list(archive_jobs())
+        self.make_job(id=job.id)
+
+        with self.assertRaises(RestoreError):
+            restore_job(ArchivedJob.objects.get())
+        self.assertTrue(ArchivedJob.objects.exists())
+
+    def test_restore_fails_when_category_deleted(self):
+        category = JobCategory.objects.create(name='Gone')
+        self.make_job(category=category)
+        list(archive_jobs())
+        category.delete()
+
+        with self.assertRaises(RestoreError):
+            restore_job(ArchivedJob.objects.get())
+        self.assertFalse(Job.objects.exists())
+
+    def test_restore_drops_deleted_applicants(self):
+        job = self.make_job()
+        gone = User.objects.create_user('gone', password='pw')
+        kept = JobApplication.objects.create(job=job, applicant=self.seeker, cover_letter='Hi')
+        dropped = JobApplication.objects.create(job=job, applicant=gone, cover_letter='Hi')
+        Interview.objects.create(application=dropped, scheduled_date=timezone.now(), duration=30,
+                                 interview_type='phone', location_or_link='Call')
+        list(archive_jobs())
+        gone.delete()
+
+        restore_job(ArchivedJob.objects.get())
+
+        self.assertEqual(list(JobApplication.objects.values_list('id', flat=True)), [kept.id])
+        self.assertFalse(Interview.objects.exists())
+
+    def test_archived_views_are_limited_to_owner(self):
+        self.make_job(title='Mine')
+        self.make_job(title='Theirs', employer=self.other_employer)
+        list(archive_jobs())
+        theirs = ArchivedJob.objects.get(title='Theirs')
+        self.client.force_login(self.employer)
+
+        response = self.client.get(reverse('employer_archived_jobs'))
+        self.assertEqual([archived.title for archived in response.context['archived_jobs']], ['Mine'])
+
+        response = self.client.post(reverse('restore_archived_job', args=[theirs.id]))
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Job.objects.exists())
+
+        mine = ArchivedJob.objects.get(title='Mine')
+        response = self.client.post(reverse('restore_archived_job', args=[mine.id]))
+        self.assertRedirects(response, reverse('employer_dashboard'))
+        self.assertEqual(list(Job.objects.values_list('title', flat=True)), ['Mine'])
+
+
+class DuplicateDetectionTests(TestCase):
+    DESCRIPTION = (
+        'We are looking for a senior python developer to build scalable web services with django '
+        'and postgres. You will design APIs, review code, mentor junior engineers and work closely '
+        'with product managers on hiring products used by millions of job seekers every month.'
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user('employer', password='pw')
+        UserProfile.objects.create(user=cls.employer, user_type='employer')
+        cls.other_employer = User.objects.create_user('other', password='pw')
+        UserProfile.objects.create(user=cls.other_employer, user_type='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+
+    def make_job(self, employer=None, description=DESCRIPTION, **fields):
+        defaults = dict(
+            title='Senior Python Developer', description=description, category=self.category,
+            job_type='full_time', location='Chennai', employer=employer or self.employer,
+            requirements='Five years of python experience', skills_required='Python',
+            application_deadline=timezone.now().date() + timedelta(days=30),
+        )
+        defaults.update(fields)
+        job = Job.objects.create(**defaults)
+        index_job(job)
+        return job
+
+    def post_data(self, description=DESCRIPTION, **extra):
+        data = {
+            'title': 'Senior Python Developer', 'description': description, 'category': self.category.id,
+            'job_type': 'full_time', 'location': 'Chennai', 'requirements': 'Five years of python experience',
+            'skills_required': 'Python',
+            'application_deadline': (timezone.now().date() + timedelta(days=30)).isoformat(),
+        }
+        data.update(extra)
+        return data
+
+    def test_minhash_similarity_tracks_text_overlap(self):
+        base = minhash(self.DESCRIPTION)
+        self.assertEqual(len(base), NUM_PERM)
+        self.assertEqual(base, minhash(self.DESCRIPTION.upper()))
+        self.assertGreaterEqual(estimated_similarity(base, minhash(self.DESCRIPTION + ' Apply today.')), 0.8)
+        self.assertLess(estimated_similarity(base, minhash('Accountant to manage ledgers and month end close.')), 0.2)
+
+    def test_minhash_of_short_text_fills_every_bin(self):
+        signature = minhash('Python developer wanted')
+        self.assertEqual(len(signature), NUM_PERM)
+        self.assertTrue(all(0 <= value < 2 ** 32 for value in signature))
+
+    def test_find_duplicates_uses_index(self):
+        job = self.make_job()
+        self.make_job(title='Accountant', description='Manage ledgers and month end close for a retailer.',
+                      requirements='CPA')
+
+        matches = find_duplicates(minhash(job_text(job)))
+        self.assertEqual([job_id for job_id, _ in matches], [job.id])
+        self.assertEqual(find_duplicates(minhash(job_text(job)), exclude_id=job.id), [])
+
+    def test_check_new_job_ignores_closed_jobs(self):
+        self.make_job(application_deadline=timezone.now().date() - timedelta(days=1))
+        self.make_job(is_active=False)
+
+        duplicate, _ = check_new_job(Job(
+            title='Senior Python Developer', description=self.DESCRIPTION,
+            requirements='Five years of python experience', employer=self.employer,
+        ))
+        self.assertIsNone(duplicate)
+
+    def test_post_job_blocks_own_duplicate_and_keeps_form(self):
+        self.make_job()
+        self.client.force_login(self.employer)
+
+        response = self.client.post(reverse('post_job'), self.post_data())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Post anyway')
+        self.assertEqual(Job.objects.count(), 1)
+
+        response = self.client.post(reverse('post_job'), self.post_data(post_anyway='1'))
+        self.assertRedirects(response, reverse('employer_dashboard'))
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_post_job_flags_other_employers_duplicate(self):
+        original = self.make_job(employer=self.other_employer)
+        self.client.force_login(self.employer)
+
+        self.client.post(reverse('post_job'), self.post_data())
+
+        posted = Job.objects.get(employer=self.employer)
+        self.assertEqual(posted.duplicate_of, original)
+        self.assertTrue(JobSignature.objects.filter(job=posted).exists())
+
+    def test_post_job_publishes_distinct_job(self):
+        self.make_job()
+        self.client.force_login(self.employer)
+
+        self.client.post(reverse('post_job'), self.post_data(
+            title='Accountant', description='Manage ledgers and month end close for a retailer.',
+            requirements='CPA'))
+
+        posted = Job.objects.get(title='Accountant')
+        self.assertIsNone(posted.duplicate_of)
+
+    def test_dedupe_command_flags_later_postings(self):
+        original = self.make_job()
+        repost = self.make_job(description=self.DESCRIPTION + ' Apply today.')
+
+        call_command('dedupe_jobs', '--deactivate', stdout=StringIO())
+
+        original.refresh_from_db()
+        repost.refresh_from_db()
+        self.assertIsNone(original.duplicate_of)
+        self.assertEqual(repost.duplicate_of, original)
+        self.assertFalse(repost.is_active)
+        self.assertIsNotNone(repost.closed_at)
+        self.assertEqual(JobSignature.objects.count(), 2)
+
+    def test_dedupe_command_ignores_closed_originals(self):
+        closed = self.make_job(application_deadline=timezone.now().date() - timedelta(days=1))
+        repost = self.make_job(description=self.DESCRIPTION + ' Apply today.')
+
+        call_command('dedupe_jobs', '--deactivate', stdout=StringIO())
+
+        closed.refresh_from_db()
+        repost.refresh_from_db()
+        self.assertIsNone(repost.duplicate_of)
+        self.assertTrue(repost.is_active)
+        self.assertIsNone(closed.duplicate_of)
+
+
+class GeoTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user('employer', password='pw')
+        UserProfile.objects.create(user=cls.employer, user_type='employer')
+        cls.category = JobCategory.objects.create(name='Engineering')
+
+    def setUp(self):
+        invalidate_index()
+        self.addCleanup(invalidate_index)
+
+    def make_job(self, title, location, job_type='full_time'):
+        job = Job(
+            title=title, description='Build things', category=self.category, job_type=job_type,
+            location=location, employer=self.employer, requirements='Python', skills_required='Python',
+            application_deadline=timezone.now().date() + timedelta(days=30),
+        )
+        set_coordinates(job)
+        job.save()
+        return job
+
+    def listed_titles(self, query):
+        response = self.client.get(reverse('job_list') + '?' + query)
+        self.assertEqual(response.status_code, 200)
+        return {job.title for job in response.context['jobs']}
+
+    def test_geocode_resolves_names_regions_and_aliases(self):
+        chennai = (13.0827, 80.2707)
+        self.assertEqual(geocode('Chennai'), chennai)
+        self.assertEqual(geocode('Chennai, Tamil Nadu'), chennai)
+        self.assertEqual(geocode('madras'), chennai)
+        self.assertEqual(geocode('New York, NY'), geocode('NYC'))
+        self.assertEqual(geocode('Bangalore (Karnataka)'), geocode('Bengaluru'))
+        self.assertIsNone(geocode('Remote'))
+        self.assertIsNone(geocode(''))
+
+    def test_parse_point_rejects_non_finite_and_out_of_range(self):
+        self.assertEqual(parse_point('13.08', '80.27'), (13.08, 80.27))
+        for lat, lon in [('nan', '1'), ('1', 'nan'), ('inf', '1'), ('-inf', '1'), ('91', '0'),
+                         ('0', '-180.5'), ('abc', '1'), (None, '1'), ('', '')]:
+            self.assertIsNone(parse_point(lat, lon), (lat, lon))
+
+    def test_parse_radius_falls_back_to_default(self):
+        self.assertEqual(parse_radius('25'), 25)
+        self.assertEqual(parse_radius('0'), 1)
+        self.assertEqual(parse_radius('1e9'), MAX_RADIUS_KM)
+        for value in ['nan', 'inf', '-inf', 'abc', '', None]:
+            self.assertEqual(parse_radius(value), DEFAULT_RADIUS_KM, value)
+
+    def test_grid_index_wraps_across_antimeridian(self):
+        index = GridIndex([(1, -16.5, 179.9), (2, -16.5, -179.9), (3, -16.5, 170.0)])
+
+        self.assertEqual(set(index.within(-16.5, 179.95, 50)), {1, 2})
+        self.assertEqual(set(index.within(-16.5, -179.95, 50)), {1, 2})
+
+    def test_radius_filter_and_remote_jobs(self):
+        self.make_job('Chennai role', 'Chennai, Tamil Nadu')
+        self.make_job('Vellore role', 'Vellore')
+        self.make_job('Bengaluru role', 'Bangalore')
+        self.make_job('Remote role', 'Anywhere', job_type='remote')
+
+        self.assertEqual(self.listed_titles('near=Chennai&radius=50'), {'Chennai role'})
+        self.assertEqual(self.listed_titles('near=Chennai&radius=250'), {'Chennai role', 'Vellore role'})
+        self.assertEqual(self.listed_titles('near=Chennai&radius=250&include_remote=1'),
+                         {'Chennai role', 'Vellore role', 'Remote role'})
+        self.assertEqual(self.listed_titles('lat=13.08&lon=80.27&radius=10'), {'Chennai role'})
+
+    def test_invalid_coordinates_do_not_crash_job_list(self):
+        self.make_job('Chennai role', 'Chennai')
+
+        for query in ['lat=nan&lon=1', 'lat=inf&lon=1', 'lat=1&lon=-inf', 'lat=95&lon=1',
+                      'near=Chennai&radius=nan', 'near=Chennai&radius=inf', 'near=Atlantis']:
+            self.assertEqual(self.listed_titles(query), {'Chennai role'}, query)
+
+    def test_coordinates_are_kept_in_the_filter_form(self):
+        self.make_job('Chennai role', 'Chennai')
+
+        response = self.client.get(reverse('job_list') + '?lat=13.08&lon=80.27&radius=10')
+        self.assertContains(response, 'name="lat" id="latInput" value="13.08"')
+        self.assertContains(response, 'name="lon" id="lonInput" value="80.27"')
+        self.assertContains(response, 'your location')
+
+        response = self.client.get(reverse('job_list') + '?near=Chennai&radius=25')
+        self.assertContains(response, 'name="lat" id="latInput" value=""')
+        self.assertContains(response, 'Within 25 km of')
+
+    def test_restored_job_appears_in_radius_search(self):
+        job = self.make_job('Chennai role', 'Chennai')
+        Job.objects.filter(id=job.id).update(application_deadline=timezone.now().date() - timedelta(days=400))
+        list(archive_jobs())
+        self.assertEqual(self.listed_titles('near=Chennai'), set())
+
+        self.client.force_login(self.employer)
+        self.client.post(reverse('restore_archived_job', args=[ArchivedJob.objects.get().id]))
+
+        self.assertEqual(self.listed_titles('near=Chennai'), {'Chennai role'})
 
-# Create your tests here.
+    def test_job_list_title_is_plain_text(self):
+        response = self.client.get(reverse('job_list'))
+        self.assertContains(response, '<title>Browse Jobs - Job Portal</title>', html=False)
+        self.assertContains(response, 'navigator.geolocation', count=2)
@@ -15,6 +15,10 @@ urlpatterns = [
     
     path('employer/dashboard/', views.employer_dashboard, name='employer_dashboard'),
     path('employer/post-job/', views.post_job, name='post_job'),
+    path('employer/archived/', views.employer_archived_jobs, name='employer_archived_jobs'),
+    path('employer/archived/<int:archived_id>/restore/', 
+         views.restore_archived_job, name='restore_archived_job'),
+    path('employer/applications/bulk/', views.bulk_update_applications, name='bulk_update_applications'),
     path('employer/application/<int:application_id>/update-status/', 
          views.update_application_status, name='update_application_status'),
     path('employer/application/<int:application_id>/schedule-interview/', 
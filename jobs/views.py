@@ -2,8 +2,12 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.db import transaction
 from django.db.models import Q
-from .models import UserProfile, Job, JobApplication, Interview, JobCategory
+from .models import UserProfile, Job, JobApplication, Interview, JobCategory, ArchivedJob
+from .archive import restore_job, RestoreError
+from .dedup import check_new_job, index_job
+from .geo import geocode, invalidate_index, jobs_near, parse_point, parse_radius, set_coordinates
 from .forms import UserRegistrationForm, UserProfileForm, JobForm, JobApplicationForm, InterviewForm
 from django.http import FileResponse
 
@@ -50,6 +54,8 @@ def post_job(request):
         messages.error(request, 'Only employers can post jobs.')
         return redirect('home')
     
+    duplicate_job = None
+    
     if request.method == 'POST':
         print("=== FORM SUBMISSION DETECTED ===")
         print("POST data:", request.POST)
@@ -64,16 +70,28 @@ def post_job(request):
             job = form.save(commit=False)
             job.employer = request.user
             job.is_active = True
-            print("Job object before save:", job.__dict__)
             
-            try:
-                job.save()
-                print("Job saved successfully! ID:", job.id)
-                messages.success(request, 'Job posted successfully!')
-                return redirect('employer_dashboard')
-            except Exception as e:
-                print("Error saving job:", str(e))
-                messages.error(request, f'Error saving job: {str(e)}')
+            duplicate, signature = check_new_job(job)
+            if duplicate and duplicate.employer_id == request.user.id and not request.POST.get('post_anyway'):
+                # Keep the form so the employer can confirm or edit instead of retyping it
+                messages.warning(request, f'This posting is nearly identical to your open job "{duplicate.title}". Tick "Post anyway" to publish it as well.')
+                duplicate_job = duplicate
+            else:
+                if duplicate:
+                    job.duplicate_of = duplicate
+                set_coordinates(job)
+                print("Job object before save:", job.__dict__)
+                
+                try:
+                    job.save()
+                    index_job(job, signature)
+                    invalidate_index()
+                    print("Job saved successfully! ID:", job.id)
+                    messages.success(request, 'Job posted successfully!')
+                    return redirect('employer_dashboard')
+                except Exception as e:
+                    print("Error saving job:", str(e))
+                    messages.error(request, f'Error saving job: {str(e)}')
         else:
             print("Form validation failed")
             print("Form errors detail:", form.errors.as_json())
@@ -88,7 +106,8 @@ def post_job(request):
     
     return render(request, 'jobs/post_job.html', {
         'form': form,
-        'categories_exist': categories.exists()
+        'categories_exist': categories.exists(),
+        'duplicate_job': duplicate_job
     })
 def job_list(request):
     # Get all active jobs with related data
@@ -99,6 +118,18 @@ def job_list(request):
     category_id = request.GET.get('category')
     job_type = request.GET.get('job_type')
     search = request.GET.get('search')
+    near = request.GET.get('near', '').strip()
+    include_remote = bool(request.GET.get('include_remote'))
+    
+    radius_km = parse_radius(request.GET.get('radius'))
+    
+    # "Near me" sends browser coordinates; otherwise geocode the typed place
+    coordinates = parse_point(request.GET.get('lat'), request.GET.get('lon'))
+    center = coordinates
+    if center is None and near:
+        center = geocode(near)
+        if center is None:
+            messages.warning(request, f'Could not find a location named "{near}".')
     
     # Apply filters
     if category_id:
@@ -111,6 +142,13 @@ def job_list(request):
             Q(description__icontains=search) |
             Q(skills_required__icontains=search)
         )
+    if center:
+        # Candidate ids come from the in-memory spatial index; remote jobs have
+        # no position and are only added back on request.
+        location_filter = Q(id__in=list(jobs_near(center[0], center[1], radius_km)))
+        if include_remote:
+            location_filter |= Q(job_type='remote')
+        jobs = jobs.filter(location_filter)
     
     categories = JobCategory.objects.all()
     
@@ -128,6 +166,14 @@ def job_list(request):
         'selected_category': category_id,
         'selected_job_type': job_type,
         'search_query': search,
+        'near_query': near,
+        'selected_radius': int(radius_km),
+        'radius_choices': [10, 25, 50, 100, 250],
+        'include_remote': include_remote,
+        'location_applied': center is not None,
+        # Echoed into the hidden lat/lon inputs so later filter changes keep the location
+        'center_lat': coordinates[0] if coordinates else '',
+        'center_lon': coordinates[1] if coordinates else '',
         'total_jobs': jobs.count()
     }
     
@@ -199,6 +245,41 @@ def employer_dashboard(request):
         'applications': applications
     })
 
+@login_required
+def employer_archived_jobs(request):
+    """Read-only list of the employer's archived jobs"""
+    if not hasattr(request.user, 'userprofile') or request.user.userprofile.user_type != 'employer':
+        messages.error(request, 'Access denied.')
+        return redirect('home')
+    
+    archived_jobs = ArchivedJob.objects.filter(employer=request.user)\
+                                       .defer('payload')\
+                                       .order_by('-archived_at')
+    
+    return render(request, 'jobs/employer_archived_jobs.html', {
+        'archived_jobs': archived_jobs
+    })
+
+@login_required
+def restore_archived_job(request, archived_id):
+    if not hasattr(request.user, 'userprofile') or request.user.userprofile.user_type != 'employer':
+        messages.error(request, 'Access denied.')
+        return redirect('home')
+    
+    archived = get_object_or_404(ArchivedJob, id=archived_id, employer=request.user)
+    
+    if request.method == 'POST':
+        try:
+            job = restore_job(archived)
+            invalidate_index()
+            messages.success(request, f'Job "{job.title}" restored from the archive.')
+        except RestoreError as e:
+            messages.error(request, f'Could not restore job: {str(e)}')
+            return redirect('employer_archived_jobs')
+        return redirect('employer_dashboard')
+    
+    return redirect('employer_archived_jobs')
+
 @login_required
 def view_resume(request, application_id):
     """View job seeker's resume"""
@@ -266,6 +347,99 @@ def update_application_status(request, application_id):
     
     return redirect('employer_dashboard')
 
+BULK_STATUSES = ('applied', 'shortlisted', 'rejected', 'hired')
+# Applications past these stages are left alone by "reject the rest"
+REJECTABLE_STATUSES = ('applied', 'shortlisted')
+
+@login_required
+def bulk_update_applications(request):
+    """
+    Apply one action to many applications in a fixed number of queries:
+    set_status on the selected applications, reject_others for every other
+    open application to the same jobs, or shortlist_top N earliest applicants
+    of one job.
+    """
+    if not hasattr(request.user, 'userprofile') or request.user.userprofile.user_type != 'employer':
+        messages.error(request, 'Access denied.')
+        return redirect('home')
+    
+    if request.method != 'POST':
+        return redirect('employer_dashboard')
+    
+    action = request.POST.get('action')
+    try:
+        selected_ids = {int(value) for value in request.POST.getlist('application_ids')}
+    except ValueError:
+        messages.error(request, 'Invalid application selection.')
+        return redirect('employer_dashboard')
+    
+    with transaction.atomic():
+        if action in ('set_status', 'reject_others'):
+            if not selected_ids:
+                messages.warning(request, 'No applications selected.')
+                return redirect('employer_dashboard')
+            
+            # Ownership check for the whole selection in one query
+            owned = dict(
+                JobApplication.objects.select_for_update()
+                                      .filter(id__in=selected_ids, job__employer=request.user)
+                                      .values_list('id', 'job_id')
+            )
+            if len(owned) != len(selected_ids):
+                messages.error(request, 'Some selected applications do not belong to your jobs.')
+                return redirect('employer_dashboard')
+            
+            if action == 'set_status':
+                new_status = request.POST.get('status')
+                if new_status not in BULK_STATUSES:
+                    messages.error(request, 'Invalid status for a bulk update.')
+                    return redirect('employer_dashboard')
+                targets = JobApplication.objects.filter(id__in=selected_ids)
+            else:
+                new_status = 'rejected'
+                targets = JobApplication.objects.filter(job_id__in=set(owned.values()),
+                                                        status__in=REJECTABLE_STATUSES)\
+                                                .exclude(id__in=selected_ids)
+        
+        elif action == 'shortlist_top':
+            try:
+                top_n = int(request.POST.get('top_n', ''))
+                job_id = int(request.POST.get('job_id', ''))
+            except ValueError:
+                messages.error(request, 'Enter how many applicants to shortlist.')
+                return redirect('employer_dashboard')
+            if top_n < 1:
+                messages.error(request, 'Enter how many applicants to shortlist.')
+                return redirect('employer_dashboard')
+            
+            if not Job.objects.filter(id=job_id, employer=request.user).exists():
+                messages.error(request, 'That job does not belong to you.')
+                return redirect('employer_dashboard')
+            
+            new_status = 'shortlisted'
+            # Evaluated here: MySQL does not allow LIMIT inside an IN subquery
+            top_ids = list(
+                JobApplication.objects.filter(job_id=job_id, job__employer=request.user, status='applied')
+                                      .order_by('applied_date', 'id')
+                                      .values_list('id', flat=True)[:top_n]
+            )
+            targets = JobApplication.objects.filter(id__in=top_ids)
+        
+        else:
+            messages.error(request, 'Unknown bulk action.')
+            return redirect('employer_dashboard')
+        
+        # Only rows whose status actually changes are written, and only that column.
+        targets = targets.exclude(status=new_status)
+        if new_status != 'hired':
+            # Leaving interview_scheduled (other than to hire) cancels the interview,
+            # so a later schedule_interview can create a fresh one
+            Interview.objects.filter(application__in=targets.filter(status='interview_scheduled')).delete()
+        updated = targets.update(status=new_status)
+    
+    messages.success(request, f'{updated} application{"s" if updated != 1 else ""} updated to {new_status}.')
+    return redirect('employer_dashboard')
+
 @login_required
 def schedule_interview(request, application_id):
     if not hasattr(request.user, 'userprofile') or request.user.userprofile.user_type != 'employer':